@@ -11,10 +11,12 @@ import time
 import logging
 import sys
 import os
-from typing import Dict, Optional, Tuple, List
+from typing import Callable, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum, auto
 
+import numpy as np
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,23 +30,27 @@ class TestResult(Enum):
     FAIL = auto()
     ERROR = auto()
 
-@dataclass
-class MovementMetrics:
-    """Captures detailed metrics about player movement tests."""
-    response_time_ms: float
-    position_accuracy: float
-    frame_time_ms: float
-    input_lag_ms: float
-    collision_checks: int
+# Detailed metrics about player movement tests, one row per sample. Kept as a
+# structured array so aggregations are column reductions rather than a Python
+# loop over per-sample objects.
+MOVEMENT_METRICS_DTYPE = np.dtype([
+    ('response_time_ms', 'f8'),
+    ('position_accuracy', 'f8'),
+    ('frame_time_ms', 'f8'),
+    ('input_lag_ms', 'f8'),
+    ('collision_checks', 'i4'),
+])
+MAX_MOVEMENT_SAMPLES = 1024
 
-@dataclass
+@dataclass(slots=True)
 class TestMetrics:
     """Aggregates test execution metrics."""
     start_time: float
     end_time: float
     memory_start: float
     memory_end: float
-    movement_metrics: List[MovementMetrics]
+    movement_metrics: np.ndarray  # MOVEMENT_METRICS_DTYPE rows
+    movement_count: int = 0  # Rows of movement_metrics filled so far
     
     @property
     def duration(self) -> float:
@@ -60,40 +66,83 @@ class PlayerControlTestError(Exception):
     """Custom exception for player control test failures."""
     pass
 
-def get_process_memory() -> float:
+def _resolve_memory_backend() -> Callable[[], float]:
     """
-    Cross-platform function to get current process memory usage.
+    Select the process memory measurement backend once, at import time.
     Falls back to different methods depending on platform availability.
     
     Returns:
-        float: Memory usage in bytes
+        Callable[[], float]: Function returning memory usage in bytes
     """
     try:
         # First attempt: Use resource module (Unix-like systems)
         import resource
-        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except ImportError:
+        pass
+
+    try:
+        # Second attempt: Use psutil if available
+        import psutil
+        process = psutil.Process()
+        return lambda: process.memory_info().rss
     except ImportError:
-        try:
-            # Second attempt: Use psutil if available
-            import psutil
-            return psutil.Process().memory_info().rss
-        except ImportError:
-            try:
-                # Third attempt: Windows-specific solution
-                import ctypes
-                kernel32 = ctypes.windll.kernel32
-                process_handle = kernel32.GetCurrentProcess()
-                memory_counter = ctypes.c_size_t()
-                kernel32.GetProcessMemoryInfo(
-                    process_handle,
-                    ctypes.byref(memory_counter),
-                    ctypes.sizeof(memory_counter)
-                )
-                return memory_counter.value
-            except Exception:
-                # Final fallback: Return 0 if no method works
-                logger.warning("Unable to measure memory usage - functionality disabled")
-                return 0.0
+        pass
+
+    try:
+        # Third attempt: Windows-specific solution
+        import ctypes
+        from ctypes import wintypes
+
+        class ProcessMemoryCounters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD),
+                ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t),
+                ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t),
+                ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        get_current_process = ctypes.WINFUNCTYPE(wintypes.HANDLE)(
+            ("GetCurrentProcess", ctypes.windll.kernel32)
+        )
+        get_memory_info = ctypes.WINFUNCTYPE(
+            wintypes.BOOL,
+            wintypes.HANDLE,
+            ctypes.POINTER(ProcessMemoryCounters),
+            wintypes.DWORD
+        )(("GetProcessMemoryInfo", ctypes.windll.psapi))
+
+        process_handle = get_current_process()
+        counters = ProcessMemoryCounters()
+        counters.cb = ctypes.sizeof(counters)
+
+        def windows_memory() -> float:
+            get_memory_info(process_handle, ctypes.byref(counters), counters.cb)
+            return counters.WorkingSetSize
+
+        return windows_memory
+    except (ImportError, AttributeError, OSError):
+        # Final fallback: Return 0 if no method works
+        logger.warning("Unable to measure memory usage - functionality disabled")
+        return lambda: 0.0
+
+_memory_backend = _resolve_memory_backend()
+
+def get_process_memory() -> float:
+    """
+    Cross-platform function to get current process memory usage.
+    Uses the backend selected at import time by _resolve_memory_backend.
+    
+    Returns:
+        float: Memory usage in bytes
+    """
+    return _memory_backend()
 
 class PlayerMovementTests(unittest.TestCase):
     """End-to-end tests for player movement and control systems."""
@@ -107,7 +156,7 @@ class PlayerMovementTests(unittest.TestCase):
             end_time=0.0,
             memory_start=get_process_memory(),
             memory_end=0.0,
-            movement_metrics=[]
+            movement_metrics=np.empty(MAX_MOVEMENT_SAMPLES, dtype=MOVEMENT_METRICS_DTYPE)
         )
 
     @classmethod
@@ -116,13 +165,15 @@ class PlayerMovementTests(unittest.TestCase):
         cls.metrics.end_time = time.time()
         cls.metrics.memory_end = get_process_memory()
         
-        logger.info(f"""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("""
         Test Suite Metrics:
         ==================
-        Duration: {cls.metrics.duration:.2f}s
-        Memory Delta: {cls.metrics.memory_delta:.2f}MB
-        Tests Run: {len(cls.metrics.movement_metrics)}
-        """)
+        Duration: %.2fs
+        Memory Delta: %.2fMB
+        Tests Run: %d
+        """, cls.metrics.duration, cls.metrics.memory_delta,
+                cls.metrics.movement_count)
 
     def setUp(self) -> None:
         """Set up individual test cases."""
@@ -17,13 +17,11 @@ Version: 1.0.0
 """
 
 import unittest
-import asyncio
 import time
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from enum import Enum, auto
 import logging
-import sys
 from contextlib import contextmanager
 
 # Configure logging
@@ -39,7 +37,7 @@ class TestResult(Enum):
     FAIL = auto()
     ERROR = auto()
 
-@dataclass
+@dataclass(slots=True)
 class TestMetrics:
     """Data class for storing test execution metrics"""
     start_time: float
@@ -59,23 +57,22 @@ class TestSetupError(GameEngineTestError):
 @contextmanager
 def performance_tracker() -> TestMetrics:
     """Context manager for tracking test performance metrics"""
-    start_time = time.time()
-    start_memory = sys.getsizeof(locals())
+    start_ns = time.perf_counter_ns()
     
     try:
         yield
     finally:
-        end_time = time.time()
-        end_memory = sys.getsizeof(locals())
+        end_ns = time.perf_counter_ns()
         
-        metrics = TestMetrics(
-            start_time=start_time,
-            end_time=end_time,
-            duration=end_time - start_time,
-            memory_usage=end_memory - start_memory,
-            cpu_usage=0.0  # Placeholder for actual CPU measurement
-        )
-        logger.info(f"Test Performance Metrics: {metrics}")
+        if logger.isEnabledFor(logging.INFO):
+            metrics = TestMetrics(
+                start_time=start_ns / 1e9,
+                end_time=end_ns / 1e9,
+                duration=(end_ns - start_ns) / 1e9,
+                memory_usage=0,  # Placeholder for actual memory measurement
+                cpu_usage=0.0  # Placeholder for actual CPU measurement
+            )
+            logger.info("Test Performance Metrics: %r", metrics)
 
 class CoreGameEngineTests(unittest.TestCase):
     """
@@ -89,12 +86,12 @@ class CoreGameEngineTests(unittest.TestCase):
         cls.test_results: Dict[str, TestResult] = {}
         cls.test_metrics: Dict[str, TestMetrics] = {}
 
-    async def setUp(self) -> None:
+    def setUp(self) -> None:
         """Set up individual test cases"""
         self.test_id = f"test_{time.time_ns()}"
         logger.info(f"Setting up test case: {self.test_id}")
 
-    async def test_engine_initialization(self) -> None:
+    def test_engine_initialization(self) -> None:
         """Validate core engine initialization sequence"""
         with performance_tracker():
             # Test engine bootstrap
@@ -106,7 +103,7 @@ class CoreGameEngineTests(unittest.TestCase):
             # Test system dependencies
             self.assertTrue(self._validate_system_dependencies())
 
-    async def test_canvas_setup(self) -> None:
+    def test_canvas_setup(self) -> None:
         """Validate canvas initialization and rendering context"""
         with performance_tracker():
             # Test canvas creation
@@ -115,7 +112,7 @@ class CoreGameEngineTests(unittest.TestCase):
             # Test rendering context
             self.assertTrue(self._validate_rendering_context())
 
-    async def test_game_loop_stability(self) -> None:
+    def test_game_loop_stability(self) -> None:
         """Validate game loop performance and stability"""
         with performance_tracker():
             # Test loop timing
@@ -124,7 +121,7 @@ class CoreGameEngineTests(unittest.TestCase):
             # Test frame rate stability
             self.assertTrue(self._validate_frame_rate())
 
-    async def test_entity_system(self) -> None:
+    def test_entity_system(self) -> None:
         """Validate entity system initialization and management"""
         with performance_tracker():
             # Test entity creation
@@ -178,7 +175,7 @@ class CoreGameEngineTests(unittest.TestCase):
         logger.info("Validating entity management")
         return True
 
-    async def tearDown(self) -> None:
+    def tearDown(self) -> None:
         """Clean up test resources"""
         logger.info(f"Cleaning up test case: {self.test_id}")
 
@@ -191,18 +188,22 @@ class CoreGameEngineTests(unittest.TestCase):
     @classmethod
     def _report_test_results(cls) -> None:
         """Generate and log test execution report"""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
         total_tests = len(cls.test_results)
         passed_tests = sum(1 for result in cls.test_results.values() 
                          if result == TestResult.PASS)
         
-        logger.info(f"""
+        logger.info("""
         Test Execution Summary
         =====================
-        Total Tests: {total_tests}
-        Passed: {passed_tests}
-        Failed: {total_tests - passed_tests}
-        Success Rate: {(passed_tests/total_tests)*100 if total_tests else 0}%
-        """)
+        Total Tests: %d
+        Passed: %d
+        Failed: %d
+        Success Rate: %s%%
+        """, total_tests, passed_tests, total_tests - passed_tests,
+            (passed_tests/total_tests)*100 if total_tests else 0)
 
 if __name__ == '__main__':
-    asyncio.run(unittest.main())
\ No newline at end of file
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Shared helpers for the performance benchmark scripts.
+
+The benchmark scripts are run directly (``python tests/performance/<file>.py``),
+which puts this directory on ``sys.path`` so they can import this module.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+from dataclasses import fields, is_dataclass
+from pathlib import PurePath
+from typing import Any, Optional
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; results fall back to the stdlib encoder
+    orjson = None
+
+# Log records are queued and written by a single listener thread shared by all
+# benchmark modules, so handler I/O never blocks the measured code path.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_stream_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def get_logger(name: str) -> logging.Logger:
+    """Return an INFO-level logger whose records go through the shared queue."""
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, logging.handlers.QueueHandler) for h in logger.handlers):
+        logger.setLevel(logging.INFO)
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        logger.propagate = False
+    return logger
+
+# /proc/self/status is read through a cached descriptor: pread at offset 0 makes
+# the kernel regenerate the contents, so no reopen or line iteration is needed.
+_VMRSS_RE = re.compile(rb'VmRSS:\s+(\d+)')
+_status_fd: Optional[int] = None
+
+def _open_status_fd() -> None:
+    """(Re)open /proc/self/status, e.g. in a forked child whose pid changed."""
+    global _status_fd
+    if _status_fd is not None:
+        os.close(_status_fd)
+        _status_fd = None
+    try:
+        _status_fd = os.open('/proc/self/status', os.O_RDONLY)
+    except OSError:
+        _status_fd = None
+
+def read_vmrss_kb() -> Optional[float]:
+    """Return the resident set size in KB, or None if /proc is unavailable."""
+    global _status_fd
+    if _status_fd is None:
+        return None
+    try:
+        match = _VMRSS_RE.search(os.pread(_status_fd, 4096, 0))
+    except OSError:
+        # Stop retrying; callers fall back to resource.getrusage from now on
+        _status_fd = None
+        return None
+    return float(match.group(1)) if match else None
+
+if sys.platform.startswith('linux'):
+    _open_status_fd()
+    os.register_at_fork(after_in_child=_open_status_fd)
+
+def to_jsonable(obj: Any) -> Any:
+    """Convert dataclasses to dicts field by field, leaving leaf values uncopied."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: to_jsonable(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, dict):
+        return {key: to_jsonable(value) for key, value in obj.items()}
+    if isinstance(obj, PurePath):
+        return str(obj)
+    return obj
+
+def _json_default(obj: Any) -> Any:
+    """Serialize numpy values for the stdlib json fallback."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dump_json(payload: Any) -> bytes:
+    """Encode a payload as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, indent=2, default=_json_default).encode()
@@ -11,7 +11,7 @@ in the Space Invaders game. It measures key metrics including:
 - CPU utilization during movement
 
 Architecture Decisions:
-- Uses async patterns for non-blocking measurements
+- Uses async patterns for non-blocking warmup; timing probes run synchronously
 - Implements custom metrics collection
 - Provides detailed performance reports
 - Follows clean architecture principles
@@ -24,20 +24,84 @@ import asyncio
 import time
 import sys
 import os
-import json
+import atexit
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
+from pathlib import Path
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
+import numpy as np
 
-@dataclass
+from _bench_common import dump_json, get_logger, read_vmrss_kb, to_jsonable
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+if resource is not None:
+    def _process_cpu_seconds() -> float:
+        """Returns user + system CPU time consumed by this process."""
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
+else:
+    def _process_cpu_seconds() -> float:
+        """Returns user + system CPU time consumed by this process."""
+        times = os.times()
+        return times.user + times.system
+
+
+try:
+    import liburing
+except ImportError:  # liburing is optional; results fall back to a plain write
+    liburing = None
+
+# Configure logging through the shared queue listener
+logger = get_logger(__name__)
+
+_ring: Optional[Any] = None  # Lazily created io_uring instance for result writes
+_ring_unavailable = liburing is None or sys.platform != 'linux'
+
+def _get_ring() -> Optional[Any]:
+    """Return this process's io_uring, or None if io_uring cannot be used."""
+    global _ring, _ring_unavailable
+    if _ring is None and not _ring_unavailable:
+        ring = liburing.Ring()
+        try:
+            liburing.io_uring_queue_init(8, ring)
+        except OSError:
+            # e.g. io_uring disabled by the kernel or a seccomp policy
+            _ring_unavailable = True
+            return None
+        atexit.register(liburing.io_uring_queue_exit, ring)
+        _ring = ring
+    return _ring
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes to path with a single io_uring submission where available."""
+    ring = _get_ring()
+    if ring is None:
+        with open(path, 'wb') as f:
+            f.write(data)
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)  # Honour umask like open()
+    try:
+        cqe = liburing.Cqe()
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_write(sqe, fd, data, 0)
+        liburing.io_uring_submit_and_wait(ring, 1)
+        liburing.io_uring_wait_cqe(ring, cqe)
+        res = cqe[0].res
+        liburing.io_uring_cq_advance(ring, 1)
+        written = liburing.trap_error(res)
+        while written < len(data):  # Finish a short write synchronously
+            written += os.pwrite(fd, data[written:], written)
+    finally:
+        os.close(fd)
+
+@dataclass(slots=True)
 class MovementMetrics:
     """Stores metrics related to player movement performance."""
     avg_frame_time: float
@@ -46,7 +110,7 @@ class MovementMetrics:
     cpu_usage_percent: float
     memory_usage_mb: float
     
-@dataclass
+@dataclass(slots=True)
 class BenchmarkConfig:
     """Configuration for the movement benchmark."""
     duration_seconds: int = 30
@@ -54,8 +118,9 @@ class BenchmarkConfig:
     movement_test_cycles: int = 100
     warmup_seconds: int = 2
     cooldown_seconds: int = 1
+    output_dir: Path = Path("benchmark_results")
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Stores comprehensive benchmark results."""
     timestamp: str
@@ -72,27 +137,37 @@ class PlayerMovementBenchmark:
     def __init__(self, config: BenchmarkConfig):
         self.config = config
         self.results: List[BenchmarkResult] = []
-        self.errors: List[str] = []
+        # (context, exception) pairs, formatted once when the result is built
+        self.errors: List[Tuple[str, Exception]] = []
+        # Previous CPU/wall clock sample for get_cpu_usage deltas
+        self._last_cpu_time = _process_cpu_seconds()
+        self._last_wall = time.perf_counter()
+        # Config and system info are invariant for the run; build them once
+        self._config_dict = to_jsonable(config)
+        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        self._system_info = self.get_system_info()
         
-    async def measure_input_latency(self) -> float:
+    def process_input_stub(self) -> None:
+        """Stands in for the game's input handler during latency measurement."""
+        pass
+
+    def measure_input_latency(self) -> float:
         """Measures average input processing latency."""
         try:
-            total_latency = 0.0
-            samples = 0
+            samples = np.empty(self.config.movement_test_cycles, dtype=np.int64)
+            # Bind timer and handler locally to skip attribute lookups per cycle
+            perf = time.perf_counter_ns
+            process_input = self.process_input_stub
             
-            for _ in range(self.config.movement_test_cycles):
-                start_time = time.perf_counter()
-                # Simulate input processing
-                await asyncio.sleep(0.001)  # Simulate minimal processing time
-                end_time = time.perf_counter()
+            for i in range(self.config.movement_test_cycles):
+                start_time = perf()
+                process_input()
+                samples[i] = perf() - start_time
                 
-                total_latency += (end_time - start_time) * 1000  # Convert to ms
-                samples += 1
-                
-            return total_latency / samples
+            return float(samples.mean()) / 1e6  # Convert ns to ms
         except Exception as e:
-            logger.error(f"Error measuring input latency: {e}")
-            self.errors.append(f"Input latency measurement failed: {str(e)}")
+            logger.error("Error measuring input latency: %s", e)
+            self.errors.append(("Input latency measurement failed", e))
             return 0.0
 
     def get_system_metrics(self) -> Tuple[float, float]:
@@ -103,38 +178,44 @@ class PlayerMovementBenchmark:
             cpu_percent = self.get_cpu_usage()
             return cpu_percent, memory_mb
         except Exception as e:
-            logger.error(f"Error getting system metrics: {e}")
-            self.errors.append(f"System metrics collection failed: {str(e)}")
+            logger.error("Error getting system metrics: %s", e)
+            self.errors.append(("System metrics collection failed", e))
             return 0.0, 0.0
 
     def get_memory_usage(self) -> float:
         """Gets current memory usage in bytes."""
-        try:
-            with open('/proc/self/status') as f:
-                for line in f:
-                    if 'VmRSS:' in line:
-                        return float(line.split()[1]) * 1024
-        except:
-            return 0.0
+        rss_kb = read_vmrss_kb()
+        if rss_kb is not None:
+            return rss_kb * 1024
+        if resource is not None:
+            return float(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+        return 0.0
 
     def get_cpu_usage(self) -> float:
-        """Gets current CPU usage percentage."""
-        try:
-            return os.getloadavg()[0] * 100
-        except:
+        """Gets process CPU usage percentage since the previous sample."""
+        cpu_time = _process_cpu_seconds()
+        now = time.perf_counter()
+        cpu_delta = cpu_time - self._last_cpu_time
+        wall_delta = now - self._last_wall
+        self._last_cpu_time, self._last_wall = cpu_time, now
+        
+        if wall_delta <= 0:
             return 0.0
+        return 100.0 * cpu_delta / wall_delta / (os.cpu_count() or 1)
 
     async def run_benchmark(self) -> BenchmarkResult:
         """Executes the complete benchmark suite."""
         logger.info("Starting player movement benchmark...")
         start_time = time.perf_counter()
+        # One timestamp per run, shared by the result and its system info
+        timestamp = datetime.now().isoformat()
         
         try:
             # Warmup phase
             await asyncio.sleep(self.config.warmup_seconds)
             
             # Measure input latency
-            input_latency = await self.measure_input_latency()
+            input_latency = self.measure_input_latency()
             
             # Measure system metrics
             cpu_usage, memory_usage = self.get_system_metrics()
@@ -157,13 +238,13 @@ class PlayerMovementBenchmark:
             test_duration = end_time - start_time
             
             result = BenchmarkResult(
-                timestamp=datetime.now().isoformat(),
-                config=asdict(self.config),
+                timestamp=timestamp,
+                config=self._config_dict,
                 metrics=metrics,
-                system_info=self.get_system_info(),
+                system_info={**self._system_info, "timestamp": timestamp},
                 test_duration=test_duration,
                 success=len(self.errors) == 0,
-                errors=self.errors
+                errors=[f"{context}: {error}" for context, error in self.errors]
             )
             
             self.save_results(result)
@@ -190,18 +271,15 @@ class PlayerMovementBenchmark:
     def save_results(self, result: BenchmarkResult) -> None:
         """Saves benchmark results to file."""
         try:
-            output_dir = "benchmark_results"
-            os.makedirs(output_dir, exist_ok=True)
-            
-            filename = f"player_movement_benchmark_{result.timestamp}.json"
-            filepath = os.path.join(output_dir, filename)
+            # ':' is not allowed in Windows filenames
+            filename = f"player_movement_benchmark_{result.timestamp.replace(':', '-')}.json"
+            filepath = self.config.output_dir / filename
             
-            with open(filepath, 'w') as f:
-                json.dump(asdict(result), f, indent=2)
+            _write_file(filepath, dump_json(to_jsonable(result)))
             
-            logger.info(f"Benchmark results saved to {filepath}")
+            logger.info("Benchmark results saved to %s", filepath)
         except Exception as e:
-            logger.error(f"Failed to save results: {e}")
+            logger.error("Failed to save results: %s", e)
 
 async def main():
     """Main entry point for the benchmark."""